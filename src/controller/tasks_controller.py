@@ -1,6 +1,6 @@
-import asyncio
 import enum
 import logging
+from collections.abc import Callable
 
 from textual.app import App
 from textual.widgets import ListView
@@ -125,7 +125,6 @@ class TasksController:
 
             # Get the selected task and set the input form values
             task = self.tasks_model.tasks[column_name][selected_task_index]
-            # input_form = self.main_tabs.tasks_tab.input_form
             task_edit_screen.set_input_values(task)
 
     def save_task(self, message: TaskEditScreen.Submit) -> None:
@@ -162,15 +161,12 @@ class TasksController:
         # Add new or edited task to the tasks model and refresh the list view
         task = tasks_model.add_task_to_dict_from_raw_data(column_name, task_raw)
         tasks_model.save_to_file()
-        self.recreate_list_view(column_name)
         self.store_index_of_new_task(column_name, task)
 
-        # Delayed (re)selection of the new or edited task so UI is fully updated
-        asyncio.get_event_loop().call_soon(
-            lambda: self.reselect_list_view_item(column_name)
-        )
-
-        self.tuido_app.call_later(
+        # (Re)select the new or edited task after the render worker synced
+        # the list view, so the selection lands on the rebuilt items
+        self.recreate_list_view(
+            column_name,
             lambda: self.reselect_list_view_item(column_name)
         )
 
@@ -196,23 +192,25 @@ class TasksController:
 
         self.index_of_new_task = -1
 
-    def recreate_list_view(self, column_name: str) -> None:
+    def recreate_list_view(self, column_name: str,
+                           on_refreshed: Callable[[], None] | None = None) \
+    -> None:
         """
         Recreates the list view for the specified column name.
 
+        The refresh is queued and applied by the TasksTab render worker,
+        which coalesces bursts of updates; the ColumnView only rebuilds
+        its items if the column's task list actually changed.
+
         Args:
             column_name: The name of the column to recreate the list view for.
+            on_refreshed: Optional callback invoked after the refresh was
+                applied; use it for anything that must see the synced list
+                view, such as restoring the selection.
         """
-        # Remove all items
-        tasks_tab = self.main_tabs.tasks_tab
-        list_view: ListView = tasks_tab.list_views[column_name]
-        list_view.clear()
-
-        # Create a new instance of ListViewItem for each task in the column
-        list_items = tasks_tab.create_list_items(column_name)
-        for list_item in list_items:
-            list_view.append(list_item)
-        tasks_tab.set_can_focus()
+        self.main_tabs.tasks_tab.request_column_refresh(
+            column_name, on_refreshed
+        )
 
     def reselect_list_view_item(self, list_view_name: str) -> None:
         """
@@ -303,17 +301,30 @@ class TasksController:
         tasks_model.sort_tasks()
         tasks_model.save_to_file()
 
-        # Update the source and target list views
+        # Update the source and target list views; the moved task is
+        # selected only after the target list view was synced, otherwise
+        # the rebuild would wipe the fresh selection
         self.recreate_list_view(source_column_name)
-        self.recreate_list_view(target_column_name)
+        self.recreate_list_view(
+            target_column_name,
+            lambda: self._select_moved_task(target_column_name, task_to_move)
+        )
 
-        # Find the index of the moved task in the target column select it
-        list_views: list[ListView] = self.main_tabs.tasks_tab.list_views
-        target_list_view: ListView = list_views[target_column_name]
+    def _select_moved_task(self, column_name: str, moved_task: Task) -> None:
+        """
+        Finds the moved task in its target column and selects it in the
+        column's list view.
+
+        Args:
+            column_name: The name of the column the task was moved to.
+            moved_task: The task that was moved.
+        """
+        target_list_view: ListView = \
+            self.main_tabs.tasks_tab.list_views[column_name]
 
         target_task_index = 0
-        for i, task in enumerate(self.tasks_model.tasks[target_column_name]):
-            if task == task_to_move:
+        for i, task in enumerate(self.tasks_model.tasks[column_name]):
+            if task == moved_task:
                 target_task_index = i
                 break
 
@@ -364,20 +375,20 @@ class TasksController:
         column_name = tasks_tab.selected_column_name
         selected_task_index = tasks_tab.selected_task_index
 
-        # Delete the selected task if one is selected
+        # Delete the selected task if one is selected; the task that jumps
+        # into the position of the deleted one is selected after the list
+        # view was synced
         if selected_task_index is not None:
             self.tasks_model.delete_task(column_name, selected_task_index)
             self.tasks_model.save_to_file()
-            self.recreate_list_view(column_name)
-
-        # Selection of the tasks that jumps into the position of the deleted one
-        asyncio.get_event_loop().call_soon(
-            lambda: self._select_task(
-                selected_task_index,
-                len(self.tasks_model.tasks[column_name]),
-                column_name
+            self.recreate_list_view(
+                column_name,
+                lambda: self._select_task(
+                    selected_task_index,
+                    len(self.tasks_model.tasks[column_name]),
+                    column_name
+                )
             )
-        )
 
     def _select_task(
         self, task_index: int, list_length: int, column_name: str
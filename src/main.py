@@ -501,10 +501,6 @@ class TuidoApp(App):
 
         self.compare_input_value_to_original(event)
 
-    # def on_tasks_input_popup_submit(self, message: TasksInputPopup.Submit) \
-    # -> None:
-    #     self.tasks_controller.save_task(message)
-
     def on_task_edit_screen_submit(self, message: TaskEditScreen.Submit) \
     -> None:
         logging.info(f'on_tasks_tab_edit_screen_submit: {message}')
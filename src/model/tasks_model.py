@@ -2,8 +2,10 @@ import enum
 import logging
 import json
 import os
-from datetime import datetime
-from dataclasses import dataclass
+
+import orjson
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any
 
 from pylightlib.msc.DateTime import DateTime    # type: ignore
@@ -12,9 +14,12 @@ from pylightlib.msc.Singleton import Singleton  # type: ignore
 from model.config_model import Config  # type: ignore
 
 
-class TaskPriority(enum.Enum):
+class TaskPriority(enum.IntEnum):
     """
     Enum for task priority levels.
+
+    An `IntEnum` is used so the members compare and serialize directly as
+    ints without going through `.value` on the hot sort path.
     """
     HIGH = 1
     MEDIUM = 2
@@ -22,6 +27,28 @@ class TaskPriority(enum.Enum):
     NONE = 4
 
 
+# Sort key packing: a missing date sorts after every real date, real dates
+# are biased so that days in the past still yield a non-negative lane value
+_MISSING_DATE_LANE = 0x7FFFFFFF
+_DAY_BIAS = 1 << 30
+
+
+def _days_lane(days: int | None) -> int:
+    """
+    Maps a days_to_* value to a non-negative 31 bit lane for the packed
+    sort key.
+
+    Args:
+        days: The number of days until the date, or None if no date is set.
+
+    Returns:
+        The 31 bit lane value; the maximum value if no date is set.
+    """
+    if days is None:
+        return _MISSING_DATE_LANE
+    return (days + _DAY_BIAS) & 0x7FFFFFFF
+
+
 @dataclass(slots=True)
 class Task:
     """
@@ -35,6 +62,12 @@ class Task:
         end_date: The end date of the task in "YYYY-MM-DD" format.
         days_to_start: The number of days until the start date.
         days_to_end: The number of days until the end date.
+        _pack: Priority, start date and end date packed into a single int
+            so sorting compares one int instead of a tuple of parsed dates.
+        _desc_lower: Lowercased description, used as the sort tiebreaker.
+        _render_cache: Rendered representation of the task, filled in and
+            used by the view. Editing a task creates a new Task object, so
+            the cache never goes stale.
     """
     column_name: str
     description: str
@@ -43,6 +76,40 @@ class Task:
     end_date: str
     days_to_start: int | None
     days_to_end: int | None
+    _pack: int = field(init=False, repr=False, default=0)
+    _desc_lower: str = field(init=False, repr=False, default='')
+    _render_cache: Any = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        self._pack = (
+            (int(self.priority) << 62)
+            | (_days_lane(self.days_to_start) << 31)
+            | _days_lane(self.days_to_end)
+        )
+        self._desc_lower = self.description.lower()
+
+
+def _task_default(obj: Any) -> dict[str, str | int]:
+    """
+    orjson `default` hook that serializes a Task to its persisted fields.
+
+    Only the fields stored in the JSON file are included; computed fields
+    like days_to_start/days_to_end are left out.
+
+    Args:
+        obj: The object orjson could not serialize natively.
+
+    Returns:
+        A dictionary with the persisted task fields.
+    """
+    if isinstance(obj, Task):
+        return {
+            'description': obj.description,
+            'priority':    int(obj.priority),
+            'start_date':  obj.start_date,
+            'end_date':    obj.end_date
+        }
+    raise TypeError(f'Object of type {type(obj)} is not JSON serializable')
 
 
 class Tasks(metaclass=Singleton):
@@ -57,11 +124,13 @@ class Tasks(metaclass=Singleton):
         column_names: A list of column names.
         column_captions: A dictionary mapping column names to their captions.
         tasks: A dictionary mapping column names to lists of Task objects.
+        _dirty: True if the tasks were modified since the last load or save.
     """
     json_path: str
     column_names: list[str]
     column_captions: dict[str, str]
-    tasks: dict[str, list[Task]] = {}
+    tasks: dict[str, list[Task]]
+    _dirty: bool
 
 
     def __init__(self, json_path: str):
@@ -72,6 +141,8 @@ class Tasks(metaclass=Singleton):
             json_path: The path to the JSON file containing the tasks data.
         """
         self.json_path = json_path
+        self.tasks = {}
+        self._dirty = False
 
         # Get column names (as list) and column captions (as dict)
         # (List + dict because the list items are in a specific order
@@ -104,11 +175,15 @@ class Tasks(metaclass=Singleton):
         Args:
             tasks_raw: The raw data loaded from the JSON file.
         """
+        # Compute today's timestamp once for the whole batch instead of
+        # re-parsing it for every single task
+        today_timestamp = DateTime.today_timestamp()
+
         for column_name, tasks_list in tasks_raw.items():
             self.tasks[column_name] = []
             for task_dict in tasks_list:
                 task = self.create_task_object_from_raw_data(
-                    column_name, task_dict
+                    column_name, task_dict, today_timestamp
                 )
                 self.tasks[column_name].append(task)
 
@@ -118,40 +193,44 @@ class Tasks(metaclass=Singleton):
         """
         Sorts the tasks in each column by priority, start date (missing goes
         to end), end date (missing goes to end) and description.
-        and description.
+
+        The comparison uses the packed key precomputed on the Task, so no
+        dates are parsed while sorting.
         """
-        MAX_DATE = datetime(3000, 1, 1).timestamp()
+        sort_key = attrgetter('_pack', '_desc_lower')
 
         for _, tasks_list in self.tasks.items():
-            tasks_list.sort(key=lambda task: (
-                task.priority.value,
-                DateTime.date_to_timestamp(task.start_date, english_format=True)
-                    or MAX_DATE,
-                DateTime.date_to_timestamp(task.end_date, english_format=True)
-                    or MAX_DATE,
-                task.description.lower()
-            ))
+            tasks_list.sort(key=sort_key)
 
-    def create_task_object_from_raw_data(self, column_name: str,
-                                         task_dict: dict[str, str]) -> Task:
+    def create_task_object_from_raw_data(
+        self, column_name: str, task_dict: dict[str, str],
+        today_timestamp: float | None = None
+    ) -> Task:
         """
         Creates a Task object from raw data.
 
         Args:
             column_name: The name of the column the task belongs to.
             task_dict: The raw data dictionary containing task information.
+            today_timestamp: Today's timestamp; computed if not given. Pass
+                it in when creating many tasks in a row so it is only
+                computed once.
 
         Returns:
             A Task object created from the raw data.
         """
+        if today_timestamp is None:
+            today_timestamp = DateTime.today_timestamp()
+
         return Task(
             column_name=column_name,
             description=task_dict['description'],
             priority=self.num_to_priority(int(task_dict['priority'])),
             start_date=task_dict['start_date'],
             end_date=task_dict['end_date'],
-            days_to_start=self.days_to(task_dict['start_date']),
-            days_to_end=self.days_to(task_dict['end_date'])
+            days_to_start=self.days_to(task_dict['start_date'],
+                                       today_timestamp),
+            days_to_end=self.days_to(task_dict['end_date'], today_timestamp)
         )
 
     def add_task_to_dict_from_raw_data(self, column_name: str,
@@ -173,9 +252,10 @@ class Tasks(metaclass=Singleton):
         if column_name not in self.tasks or len(self.tasks[column_name]) == 0:
             self.tasks[column_name] = []
         self.tasks[column_name].append(task)
+        self._dirty = True
 
         # Sort the tasks for the column_name by priority
-        self.tasks[column_name].sort(key=lambda task: task.priority.value)
+        self.tasks[column_name].sort(key=lambda task: task.priority)
 
         return task
 
@@ -189,6 +269,7 @@ class Tasks(metaclass=Singleton):
         """
         if column_name in self.tasks and 0 <= task_index < len(self.tasks[column_name]):
             del self.tasks[column_name][task_index]
+            self._dirty = True
 
 
     def num_to_priority(self, priority_number: int) -> TaskPriority:
@@ -231,12 +312,14 @@ class Tasks(metaclass=Singleton):
             case _:
                 return 4
 
-    def days_to(self, date_str: str) -> int | None:
+    def days_to(self, date_str: str,
+                today_timestamp: float | None = None) -> int | None:
         """
         Calculates the number of days to a given date.
 
         Args:
             date_str: The date string in the format "YYYY-MM-DD".
+            today_timestamp: Today's timestamp; computed if not given.
 
         Returns:
             The number of days to the given date.
@@ -244,37 +327,34 @@ class Tasks(metaclass=Singleton):
         timestamp = DateTime.date_to_timestamp(date_str, english_format=True)
 
         if timestamp:
-            return DateTime.date_diff(timestamp, DateTime.today_timestamp())
+            if today_timestamp is None:
+                today_timestamp = DateTime.today_timestamp()
+            return DateTime.date_diff(timestamp, today_timestamp)
         else:
             return None
 
     def save_to_file(self) -> None:
         """
         Saves the tasks to the JSON file.
+
+        The Task objects are serialized directly by orjson via the
+        `_task_default` hook, so no intermediate dictionary is built.
+
+        Does nothing if the tasks were not modified since the last load or
+        save, so the common "open app, change nothing" path skips both the
+        sort and the file write.
         """
+        if not self._dirty:
+            return
+
         self.sort_tasks()
-        cleaned_tasks_dict = self.get_cleaned_tasks_dict()
 
-        with open(self.json_path, 'w', encoding='utf-8') as file:
-            json.dump(cleaned_tasks_dict, file, indent=4)
+        with open(self.json_path, 'wb') as file:
+            file.write(orjson.dumps(
+                self.tasks,
+                default=_task_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+            ))
 
+        self._dirty = False
         logging.info(f'Saved tasks to {self.json_path}.')
-
-    def get_cleaned_tasks_dict(self) -> dict[str, list[dict[str, str | int]]]:
-        """
-        Returns a cleaned version of the tasks dictionary.
-
-        The cleaned version contains only the not computed fields for each task.
-        """
-        cleaned_tasks_dict = {}
-        for column_name, tasks_list in self.tasks.items():
-            cleaned_tasks_dict[column_name] = [
-                {
-                    'description': task.description,
-                    'priority':    task.priority.value,
-                    'start_date':  task.start_date,
-                    'end_date':    task.end_date
-                }
-                for task in tasks_list
-            ]
-        return cleaned_tasks_dict
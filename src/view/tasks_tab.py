@@ -1,10 +1,14 @@
 from __future__ import annotations
+import asyncio
 import logging
+import weakref
+from collections.abc import Callable
 
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.events import Key, Focus, Blur
+from textual.timer import Timer
 from textual.widgets import Static, ListView, ListItem, Label
 from rich.text import Text
 
@@ -13,6 +17,104 @@ from pylightlib.msc.Utils import Utils
 from model.tasks_model import Task, TaskPriority
 
 
+# Number of ListItems mounted initially per column and mounted additionally
+# whenever the selection approaches the end of the mounted window
+_MOUNT_BATCH = 32
+
+# How close (in items) the selection may get to the end of the mounted
+# window before the next batch is mounted
+_MOUNT_PREFETCH = 4
+
+# Styled column header Texts, built once per caption and reused on every
+# compose
+_header_text_cache: dict[str, Text] = {}
+
+# Prefixes for the start and end date lines of a task
+_START_DATE_PREFIX = '▶ '
+_END_DATE_PREFIX = '◼ '
+
+# Date style indexed by (days > 0) + (days >= 0): past, today, future
+_DATE_STYLE = ('red', 'yellow', 'green')
+
+# Text and style for an unset date
+_EMPTY_DATE = (None, '')
+
+
+def _date_text_and_style(date: str, days: int,
+                         overdue: bool = True) -> tuple[str, str]:
+    """
+    Returns the text and style for a task date.
+
+    The text is formatted as "YYYY-MM-DD (x d)" where x is the number of
+    days until the date. The style is looked up from a table instead of
+    chained branches: green for future dates, yellow for today and red for
+    past dates. If `overdue` is False, a date in the past is styled yellow
+    instead of red (used for start dates while the end date has not passed
+    yet).
+
+    Args:
+        date: The date string in "YYYY-MM-DD" format.
+        days: The number of days until the date.
+        overdue: Whether a date in the past counts as overdue (red).
+
+    Returns:
+        The formatted date text and its style.
+    """
+    style = _DATE_STYLE[(days > 0) + (days >= 0)]
+
+    if style == 'red' and not overdue:
+        style = 'yellow'
+
+    return f'{date} ({days} d)', style
+
+
+def _assemble_task_text(description: str,
+                        start_date_text: str | None, start_date_style: str,
+                        end_date_text: str | None, end_date_style: str) \
+-> Text:
+    """
+    Assembles the complete content of a task's ListItem into one styled
+    Text: the description, an empty line if any date is set, and the
+    start/end date lines.
+
+    Using a single Text inside a single Static (instead of one Static per
+    line) cuts the widget count per task to one.
+
+    Args:
+        description: The task description.
+        start_date_text: The formatted start date; None if not set.
+        start_date_style: The style for the start date line.
+        end_date_text: The formatted end date; None if not set.
+        end_date_style: The style for the end date line.
+
+    Returns:
+        The assembled Text.
+    """
+    has_dates = start_date_text is not None or end_date_text is not None
+
+    parts = [(description + ('\n\n' if has_dates else ''), 'bold')]
+
+    if start_date_text is not None:
+        parts.append((
+            _START_DATE_PREFIX + start_date_text
+            + ('\n' if end_date_text is not None else ''),
+            start_date_style
+        ))
+
+    if end_date_text is not None:
+        parts.append((_END_DATE_PREFIX + end_date_text, end_date_style))
+
+    return Text.assemble(*parts)
+
+
+# CSS class per task priority, used to color-code the ListItems
+_PRIO_CLASS = {
+    TaskPriority.HIGH:   'task_prio_high',
+    TaskPriority.MEDIUM: 'task_prio_medium',
+    TaskPriority.LOW:    'task_prio_low',
+}
+
+
 class CustomListView(ListView):
     """
     Custom ListView that scrolls the parent container (`VerticalScroll`).
@@ -23,17 +125,34 @@ class CustomListView(ListView):
 
     This is a workaround until the ListView is fixed.
 
+    Only a window of ListItems is mounted initially; further items are
+    mounted in batches as the selection moves towards the end of the
+    window, so columns with many tasks don't pay the full mounting cost
+    up-front.
+
     Attributes:
         vertical_scroll: The parent container that is scrolled.
         tasks_tab: The TasksTab object that contains the list of tasks.
         column_name: The name of the column the ListView belongs to.
         loop_behavior: Determines if the list view should loop when reaching
             the end.
+        _pending_items: ListItems created for this column but not yet
+            mounted.
+        _pending_index: The most recent selection index that still has to
+            be applied to the UI.
+        _flush_timer: Timer that applies the pending selection; None if no
+            flush is scheduled.
+        _selected_item: The item currently carrying the 'selected' class;
+            None if no item is selected.
     """
     vertical_scroll: VerticalScroll
     tasks_tab: TasksTab
     column_name: str
     loop_behavior: bool
+    _pending_items: list[ListItem]
+    _pending_index: int | None
+    _flush_timer: Timer | None
+    _selected_item: ListItem | None
 
 
     def __init__(self, vertical_scroll: VerticalScroll, tasks_tab: TasksTab,
@@ -45,15 +164,64 @@ class CustomListView(ListView):
             vscroll: The parent container that is scrolled.
             loop_behavior: Determines if the list view should loop when
                 reaching the end.
-            *args: Positional arguments for the ListView.
+            *args: The ListItems of the column. Only the first batch is
+                mounted immediately; the rest is mounted on demand.
             **kwargs: Keyword arguments for the ListView.
         """
-        super().__init__(*args, **kwargs)
+        items = list(args)
+        super().__init__(*items[:_MOUNT_BATCH], **kwargs)
+        self._pending_items = items[_MOUNT_BATCH:]
         self.vertical_scroll = vertical_scroll
         self.vertical_scroll.can_focus = False
         self.tasks_tab = tasks_tab
         self.column_name = column_name
         self.loop_behavior = loop_behavior
+        self._pending_index = None
+        self._flush_timer = None
+        self._selected_item = None
+
+    def _ensure_mounted(self, index: int) -> None:
+        """
+        Mounts pending ListItems until the given index (plus a small
+        prefetch margin) is available.
+
+        Args:
+            index: The item index that needs to be mounted.
+        """
+        while self._pending_items \
+        and len(self.children) <= index + _MOUNT_PREFETCH:
+            self._mount_next_batch()
+
+    def _mount_next_batch(self) -> None:
+        """
+        Mounts the next batch of pending ListItems, if any.
+        """
+        if self._pending_items:
+            batch = self._pending_items[:_MOUNT_BATCH]
+            del self._pending_items[:_MOUNT_BATCH]
+            self.extend(batch)
+
+    def _mount_remaining(self) -> None:
+        """
+        Mounts all ListItems that are still pending.
+        """
+        if self._pending_items:
+            self.extend(self._pending_items)
+            self._pending_items = []
+
+    def replace_items(self, items: list[ListItem]) -> None:
+        """
+        Replaces all items of the list view with the given ones and resets
+        the selection and mounting state.
+
+        Args:
+            items: The new ListItems for this column.
+        """
+        self.clear()
+        self._pending_items = []
+        self._pending_index = None
+        self._selected_item = None
+        self.extend(items)
 
     async def on_key(self, event: Key) -> None:
         """
@@ -85,8 +253,17 @@ class CustomListView(ListView):
         if not self.loop_behavior or event.key not in ('up', 'down'):
             return False
 
-        # Abort if current index is not the first or last index
         current_index = self.index or 0
+
+        # Wrapping from the top to the bottom requires the bottom items to
+        # exist; wrapping from the bottom only applies once all items are
+        # mounted (otherwise the window is simply extended while scrolling)
+        if event.key == 'up' and current_index == 0:
+            self._mount_remaining()
+        elif self._pending_items:
+            return False
+
+        # Abort if current index is not the first or last index
         list_bounds = (0, len(self.children) - 1)
         if current_index not in list_bounds:
             return False
@@ -127,6 +304,10 @@ class CustomListView(ListView):
         if event.key not in ('up', 'down'):
             return None
 
+        # Extend the mounted window if the selection approaches its end
+        if event.key == 'down':
+            self._ensure_mounted(index + 1)
+
         # Adjust index if loop behavior was NOT applied (if loop_applied is
         # True, it means the index was already adjusted, so leave it as is)
         if not loop_applied:
@@ -135,27 +316,53 @@ class CustomListView(ListView):
             elif event.key == 'down':
                 index = min(len(self.children) - 1, index + 1)
 
-        # Get the item at the new index and scroll to it
+        # Coalesce rapid key repeats: remember only the final index and
+        # schedule a single flush that performs the scroll and class update
+        self._pending_index = index
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(0.016, self._flush_selection)
+
+    def _flush_selection(self) -> None:
+        """
+        Applies the most recent pending selection to the UI.
+
+        Scrolls the parent container to the selected item, updates its
+        class and updates the selected item information in the TasksTab.
+        Intermediate indices from rapid key repeats are dropped.
+        """
+        self._flush_timer = None
+        index = self._pending_index
+
+        if index is None or index >= len(self.children):
+            return
+
+        self._pending_index = None
+
+        # Get the item at the pending index and scroll to it
         item = self.children[index]
         self.vertical_scroll.scroll_to_widget(item)
         self.change_class(index)
         self.tasks_tab.selected_column_name = self.column_name
-        self.tasks_tab.selected_task_index = index or 0
+        self.tasks_tab.selected_task_index = index
 
     def change_class(self, index: int) -> None:
         """
         Changes the class of the currently selected item.
 
-        This method is called to update the class of the currently selected item
-        in the ListView. It removes the 'selected' class from all items and adds
-        'selected' class to the currently selected item.
+        Only the previously selected item and the item at the given index
+        are touched, so the update is O(1) instead of a scan over all
+        children.
         """
-        for i, item in enumerate(self.children):
-            if isinstance(item, ListItem):
-                if i == index:
-                    item.add_class('selected')
-                else:
-                    item.remove_class('selected')
+        if self._selected_item is not None:
+            self._selected_item.remove_class('selected')
+            self._selected_item = None
+
+        if index >= len(self.children):
+            return
+
+        new_item = self.children[index]
+        new_item.add_class('selected')
+        self._selected_item = new_item
 
     def on_focus(self, event: Focus) -> None:
         """
@@ -163,11 +370,8 @@ class CustomListView(ListView):
 
         This method is called when the ListView gains focus. It adds
         the 'selected' class to the currently selected item and removes it
-        from all other items.
+        from the previously selected item.
         """
-        for item in self.children:
-            item.remove_class('selected')
-
         self.change_class(self.index or 0)
         self.tasks_tab.selected_column_name = self.column_name
         self.tasks_tab.selected_task_index = self.index or 0
@@ -177,19 +381,20 @@ class CustomListView(ListView):
         Handles the blur event for the ListView.
 
         This method is called when the ListView loses focus. It removes the
-        'selected' class from all items to indicate that no item is currently
-        selected.
+        'selected' class from the selected item to indicate that no item is
+        currently selected.
         """
-        for item in self.children:
-            item.remove_class('selected')
+        if self._selected_item is not None:
+            self._selected_item.remove_class('selected')
+            self._selected_item = None
 
     async def on_list_view_selected(self, event: ListView.Selected):
         """
         Handles the selection event for the ListView.
 
         This method is called when an item in the ListView is selected with
-        the cursor. It adds  the 'selected' class to the currently selected
-        item and removes it from all other items.
+        the cursor. It adds the 'selected' class to the newly selected item
+        and removes it from the previously selected one.
 
         Note:
             Function definition equivalent to:
@@ -198,14 +403,150 @@ class CustomListView(ListView):
             def ...
             ```
         """
-        for item in self.children:
-            item.remove_class('selected')
+        if self._selected_item is not None:
+            self._selected_item.remove_class('selected')
 
         event.item.add_class('selected')
+        self._selected_item = event.item
         self.tasks_tab.selected_column_name = self.column_name
         self.tasks_tab.selected_task_index = self.index or 0
 
 
+class ColumnScroll(VerticalScroll):
+    """
+    VerticalScroll for a task column that extends the list view's mounted
+    window when the user scrolls towards its end.
+
+    Keyboard navigation grows the window through the list view's key
+    handling, but mouse-wheel and scrollbar scrolling only move this
+    container — without this hook, items beyond the initially mounted
+    window would stay unreachable for mouse users.
+
+    Attributes:
+        list_view: The CustomListView whose pending items are mounted.
+    """
+    list_view: CustomListView | None = None
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+
+        list_view = self.list_view
+        if list_view is not None and list_view._pending_items \
+        and new_value >= self.max_scroll_y - _MOUNT_PREFETCH:
+            list_view._mount_next_batch()
+
+
+class ColumnView(Vertical):
+    """
+    A single Kanban column: the column header plus the task list view
+    inside a vertical scroll container.
+
+    ColumnView instances are created once per column and cached by the
+    TasksTab, so recomposing the tab does not rebuild unchanged columns.
+    `sync` compares the column's current task list against the one the
+    list view was last built from and only rebuilds on change.
+
+    Attributes:
+        tasks_tab: The TasksTab the column belongs to.
+        column_name: The name of the column.
+        list_view: The CustomListView displaying the column's tasks.
+        _last_sig: Signature of the task list the list view was last
+            built from.
+    """
+    tasks_tab: TasksTab
+    column_name: str
+    list_view: CustomListView
+    _last_sig: tuple[int, ...] | None
+
+
+    def __init__(self, tasks_tab: TasksTab, column_name: str,
+                 **kwargs) -> None:
+        """
+        Initializes the ColumnView.
+
+        Args:
+            tasks_tab: The TasksTab the column belongs to.
+            column_name: The name of the column.
+        """
+        super().__init__(**kwargs)
+        self.tasks_tab = tasks_tab
+        self.column_name = column_name
+        self._last_sig = None
+
+    def compose(self) -> ComposeResult:
+        """
+        Composes the column header and the list view.
+        """
+        tasks_tab = self.tasks_tab
+        column_name = self.column_name
+
+        # Header for the column (the styled Text is built once per caption
+        # and cached)
+        caption = tasks_tab.column_captions[column_name]
+        text = _header_text_cache.get(caption)
+        if text is None:
+            text = _header_text_cache.setdefault(
+                caption, Text(caption, style='bold')
+            )
+        yield(Label(text, classes='task_column_header'))
+
+        # ListView for the column
+        vscroll = ColumnScroll(classes='task_column_vscroll')
+        with vscroll:
+            self.list_view = CustomListView(
+                vscroll, tasks_tab, column_name, True,
+                *tasks_tab.create_list_items(column_name)
+            )
+            vscroll.list_view = self.list_view
+            tasks_tab.list_views[column_name] = self.list_view
+            yield self.list_view
+
+        self._last_sig = self._signature()
+
+    def _signature(self) -> tuple[int, ...]:
+        """
+        Returns a signature of the column's current task list, used to
+        detect whether the list view needs to be rebuilt.
+        """
+        tasks = self.tasks_tab.tasks.get(self.column_name)
+
+        if not tasks:
+            return ()
+
+        return tuple(id(task) for task in tasks)
+
+    def sync(self) -> None:
+        """
+        Refreshes the list view if the column's task list changed since the
+        last build; does nothing otherwise.
+
+        Already mounted ListItems are updated in place where possible, so
+        the common case of editing a task reuses the existing widgets
+        instead of constructing and mounting new ones. Only if the number
+        of tasks changed, the items are rebuilt.
+        """
+        sig = self._signature()
+
+        if sig == self._last_sig:
+            return
+
+        self._last_sig = sig
+        tasks_tab = self.tasks_tab
+        list_view = self.list_view
+        tasks = tasks_tab.tasks.get(self.column_name) or []
+
+        # Update the mounted items in place (only possible while the item
+        # count is unchanged)
+        if not list_view._pending_items \
+        and len(list_view.children) == len(tasks):
+            for task, list_item in zip(tasks, list_view.children):
+                tasks_tab.update_list_item(list_item, task)
+        else:
+            list_view.replace_items(
+                tasks_tab.create_list_items(self.column_name)
+            )
+
+
 class TasksTab(Static):
     """
     Tasks tab content.
@@ -224,21 +565,27 @@ class TasksTab(Static):
     Attributes:
         tuido_app: The main application instance.
         list_views: A dictionary of CustomListView objects for each column.
+            Weak references are used so detached list views can be
+            reclaimed instead of accumulating over the app's lifetime.
+        column_views: A dictionary of cached ColumnView widgets for each
+            column.
         column_names: A list of column names.
         column_captions: A dictionary mapping column names to their captions.
         tasks: A dictionary mapping column names to lists of Task objects.
-        input_form: The input form for adding or editing tasks.
         selected_column_name: The name of the currently selected column.
         selected_task_index: The index of the currently selected task.
+        _update_queue: Queue of column names whose list views need to be
+            refreshed; drained in batches by the render worker.
     """
     tuido_app: App
-    list_views: dict[str, CustomListView] = {}
+    list_views: weakref.WeakValueDictionary[str, CustomListView]
+    column_views: dict[str, ColumnView]
     column_names: list[str]
     column_captions: dict[str, str]
     tasks: dict[str, list[Task]]
-    input_form: TasksInputPopup
     selected_column_name: str
     selected_task_index: int
+    _update_queue: asyncio.Queue
 
 
     def __init__(self, tuido_app: App, **kwargs) -> None:
@@ -250,29 +597,83 @@ class TasksTab(Static):
         """
         super().__init__(**kwargs)
         self.tuido_app = tuido_app
+        self.list_views = weakref.WeakValueDictionary()
+        self.column_views = {}
+        self._update_queue = asyncio.Queue()
+
+    def on_mount(self) -> None:
+        """
+        Starts the render worker that applies queued column refreshes.
+        """
+        self.run_worker(self._render_worker())
+
+    def request_column_refresh(self, column_name: str,
+                               on_synced: Callable[[], None] | None = None) \
+    -> None:
+        """
+        Queues a refresh of the given column's list view.
+
+        The actual UI update is performed by the render worker, which
+        coalesces bursts of refresh requests into a single batch.
+
+        Args:
+            column_name: The name of the column to refresh.
+            on_synced: Optional callback invoked after the batch containing
+                this request was applied. Selection restores must go
+                through this hook, otherwise they race the deferred sync
+                and are clobbered when the list view is rebuilt.
+        """
+        self._update_queue.put_nowait((column_name, on_synced))
+
+    async def _render_worker(self) -> None:
+        """
+        Drains the update queue and refreshes the affected columns.
+
+        After the first request arrives, further requests within the same
+        frame are collected so each column is synced at most once per
+        batch, keeping the UI responsive under bursty model updates. The
+        callbacks of the batch run after all its columns were synced.
+        """
+        while True:
+            column_name, callback = await self._update_queue.get()
+            pending = {column_name}
+            callbacks = [callback] if callback is not None else []
+
+            # Collect further requests arriving within the same frame
+            await asyncio.sleep(0.016)
+            while not self._update_queue.empty():
+                column_name, callback = self._update_queue.get_nowait()
+                pending.add(column_name)
+                if callback is not None:
+                    callbacks.append(callback)
+
+            for column_name in pending:
+                column_view = self.column_views.get(column_name)
+                if column_view is not None:
+                    column_view.sync()
+
+            self.set_can_focus()
+
+            # Selection restores etc. run only now, on the synced views
+            for callback in callbacks:
+                callback()
 
     def compose(self) -> ComposeResult:
         """
         Composes the tasks tab content.
+
+        The ColumnView widgets are created once per column and cached, so
+        subsequent composes reuse them instead of rebuilding every column.
         """
         with Horizontal():
             for column_name in self.column_names:
-                list_items = self.create_list_items(column_name)
-
-                with Vertical():
-                    # Header for the column
-                    text = Text(f'{self.column_captions[column_name]}',
-                                style='bold')
-                    yield(Label(text, classes='task_column_header'))
-
-                    # ListView for the column
-                    vscroll = VerticalScroll(classes='task_column_vscroll')
-                    with vscroll:
-                        list_view = CustomListView(
-                            vscroll, self, column_name, True, *list_items
-                        )
-                        self.list_views[column_name] = list_view
-                        yield list_view
+                column_view = self.column_views.get(column_name)
+
+                if column_view is None:
+                    column_view = ColumnView(self, column_name)
+                    self.column_views[column_name] = column_view
+
+                yield column_view
 
     async def on_key(self, event: Key) -> None:
         """
@@ -302,129 +703,77 @@ class TasksTab(Static):
         """
         # Return empty list if the column doesn't have any tasks
         list_items: list[ListItem] = []
-        if column_name not in self.tasks.keys():
+        tasks = self.tasks.get(column_name)
+        if tasks is None:
             return list_items
 
-        # Create a ListItem for each task
-        for task in self.tasks[column_name]:
-            start_date_text, start_date_style = \
-                self.start_date_text_and_style(task)
-            end_date_text, end_date_style = self.end_date_text_and_style(task)
-
-            list_item = ListItem(
-                # Description
-                Static(Text(task.description, style='bold')),
-
-                # Empty line if start date or end date is set
-                *[Static()] if start_date_text is not None
-                            or end_date_text is not None else [],
-
-                # Start date
-                *([Static(Text(
-                    '▶ ' + start_date_text, style=start_date_style
-                ))] if start_date_text is not None else []),
-
-                # End date
-                *([Static(Text(
-                    '◼ ' + end_date_text, style=end_date_style
-                ))] if end_date_text is not None else []),
+        # Create a ListItem with a single Static for each task
+        for task in tasks:
+            list_item = ListItem(Static(self.get_render_text(task)))
+            list_item.add_class(
+                _PRIO_CLASS.get(task.priority, 'task_prio_none')
             )
-
-            self.set_priority_class(list_item, task)
             list_items.append(list_item)
 
         return list_items
 
-    def start_date_text_and_style(self, task: Task) -> tuple[str | None, str]:
+    def update_list_item(self, list_item: ListItem, task: Task) -> None:
         """
-        Returns the text and style for the start date of a task.
-
-        The date text is formatted as "YYYY-MM-DD (x d)" where x is the
-        number of days until the start date.
-
-        The style is determined based on the number of days until the date:
-            - Green: if the date is in the future (x > 0)
-            - Yellow: if the date is today (x = 0)
-            - Red: if the start date is in the past (x < 0) and end date is
-                in the past, too.
-
-        If the date is not set, it returns None for the text and an empty
-        style string.
+        Updates a mounted ListItem in place with the data of the given
+        task, reusing its single Static child widget.
 
         Args:
-            task: The task object.
+            list_item: The mounted ListItem to update.
+            task: The task whose data should be displayed.
         """
-        start_date_text = None
-        start_date_style = ''
-
-        if task.start_date is not None and task.start_date != '':
-            start_date_text = f'{task.start_date} ({task.days_to_start} d)'
-
-            if task.days_to_start > 0:
-                start_date_style = 'green'
-            elif (task.end_date is not None and task.end_date != '') \
-                 and (task.days_to_start < 0 and task.days_to_end < 0):
-                start_date_style = 'red'
-            elif task.days_to_start <= 0:
-                start_date_style = 'yellow'
+        list_item.children[0].update(self.get_render_text(task))
 
-        return start_date_text, start_date_style
+        # Replaces the priority class and drops a stale 'selected' class
+        list_item.set_classes(
+            _PRIO_CLASS.get(task.priority, 'task_prio_none')
+        )
 
-    def end_date_text_and_style(self, task: Task) -> tuple[str | None, str]:
+    def get_render_text(self, task: Task) -> Text:
         """
-        Returns the text and style for the end date of a task.
-
-        The date text is formatted as "YYYY-MM-DD (x d)" where x is the
-        number of days until the end date.
+        Returns the assembled ListItem content for a task.
 
-        The style is determined based on the number of days until the date:
-            - Green: if the date is in the future (x > 0)
-            - Yellow: if the date is today (x = 0)
-            - Red: if the date is in the past (x < 0)
-
-        If the date is not set, it returns None for the text and an empty
-        style string.
+        The assembled Text is cached on the Task so rebuilding a list view
+        does not re-format or re-assemble unchanged tasks. Editing a task
+        creates a new Task object, which starts with an empty cache.
 
         Args:
             task: The task object.
-        """
-        end_date_text = None
-        end_date_style = ''
-
-        if task.end_date is not None and task.end_date != '':
-            end_date_text = f'{task.end_date} ({task.days_to_end} d)'
-
-            if task.days_to_end > 0:
-                end_date_style = 'green'
-            elif task.days_to_end == 0:
-                end_date_style = 'yellow'
-            elif task.days_to_end < 0:
-                end_date_style = 'red'
 
-        return end_date_text, end_date_style
+        Returns:
+            The assembled Text for the task's ListItem.
+        """
+        render_text = task._render_cache
+
+        if render_text is None:
+            # Tasks without dates (the common case) skip the formatting
+            # helper entirely
+            if task.start_date:
+                start_date_text, start_date_style = _date_text_and_style(
+                    task.start_date, task.days_to_start,
+                    overdue=bool(task.end_date) and task.days_to_end < 0
+                )
+            else:
+                start_date_text, start_date_style = _EMPTY_DATE
 
-    def set_priority_class(self, list_item: ListItem, task: Task) -> None:
-        """
-        Sets the class for the ListItem based on the task's priority.
+            if task.end_date:
+                end_date_text, end_date_style = _date_text_and_style(
+                    task.end_date, task.days_to_end
+                )
+            else:
+                end_date_text, end_date_style = _EMPTY_DATE
 
-        The class is used to color-code the task based on its priority:
-            - High priority: 'task_prio_high'
-            - Medium priority: 'task_prio_medium'
-            - Low priority: 'task_prio_low'
+            render_text = _assemble_task_text(
+                task.description, start_date_text, start_date_style,
+                end_date_text, end_date_style
+            )
+            task._render_cache = render_text
 
-        Args:
-            list_item: The ListItem to set the class for.
-            task: The task object.
-        """
-        match task.priority:
-            case TaskPriority.HIGH:
-                list_item.add_class('task_prio_high')
-            case TaskPriority.MEDIUM:
-                list_item.add_class('task_prio_medium')
-            case TaskPriority.LOW:
-                list_item.add_class('task_prio_low')
-            case _:
-                list_item.add_class('task_prio_none')
+        return render_text
 
     def set_can_focus(self):
         """
@@ -432,8 +781,5 @@ class TasksTab(Static):
         attribute to True if it does.
         """
         for column_name in self.column_names:
-            if column_name in self.tasks.keys() \
-            and len(self.tasks[column_name]) > 0:
-                self.list_views[column_name].can_focus = True
-            else:
-                self.list_views[column_name].can_focus = False
+            self.list_views[column_name].can_focus = \
+                bool(self.tasks.get(column_name))
@@ -1,7 +1,7 @@
 import logging  # noqa # type: ignore
-import re
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from textual import work
@@ -11,6 +11,7 @@ from textual.binding import Binding
 from textual.containers import HorizontalGroup, VerticalGroup
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Input, Label, Select, MaskedInput, ListView, Static, Footer
 
 from pylightlib.textual.question_screen import QuestionScreen
@@ -19,6 +20,91 @@ from model.tasks_model import Task, TaskPriority
 from model.config_model import Config
 
 
+# Maps a task priority to the label shown in the priority Select;
+# TaskPriority.NONE has no label and maps to None via .get()
+_PRIORITY_LABEL = {
+    TaskPriority.HIGH:   'High',
+    TaskPriority.MEDIUM: 'Medium',
+    TaskPriority.LOW:    'Low',
+}
+
+# Options for the priority Select, shared by all instances instead of
+# being rebuilt from a list + generator on every modal open
+_PRIORITY_OPTIONS = (('Low', 'Low'), ('Medium', 'Medium'), ('High', 'High'))
+
+# Weekday names indexed by date.weekday(); a tuple lookup avoids running
+# strftime('%A') (format-string walk + locale lookup) per keystroke
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+             'Saturday', 'Sunday')
+
+
+@lru_cache(maxsize=512)
+def _parse_ymd(date_str: str) -> datetime | None:
+    """
+    Parses a date string in the format "YYYY-MM-DD".
+
+    The result is memoized because the same string is parsed several times
+    per keystroke (validation plus both weekday labels), so repeat lookups
+    hit the cache instead of re-running the parser.
+
+    Args:
+        date_str: The date string to parse.
+
+    Returns:
+        The parsed datetime, or None if the string is not a valid date.
+    """
+    # fromisoformat is a dedicated C parser, but since Python 3.11 it
+    # accepts more ISO-8601 forms than "YYYY-MM-DD"; the shape check
+    # keeps those out
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        return None
+
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _shift_day(date_str: str, delta: timedelta) -> str | None:
+    """
+    Returns a date string shifted by the given delta.
+
+    Memoized so oscillating adjustments (increase followed by decrease
+    and vice versa) reuse earlier results instead of parsing and
+    formatting again.
+
+    Args:
+        date_str: The date string to shift.
+        delta: The time span to shift the date by.
+
+    Returns:
+        The shifted date string, or None if the input is not a valid date.
+    """
+    parsed = _parse_ymd(date_str)
+    if parsed is None:
+        return None
+
+    return (parsed + delta).date().isoformat()
+
+
+def _is_valid_date(date_str: str) -> bool:
+    """
+    Checks if a string is a valid date in the format "YYYY-MM-DD".
+
+    Validation has no screen state, so it lives at module level and goes
+    through the memoized parser; repeat validations of the same string
+    are a cache hit.
+
+    Args:
+        date_str: The date string to validate.
+
+    Returns:
+        bool: True if the date string is valid, False otherwise.
+    """
+    return _parse_ymd(date_str) is not None
+
+
 class DateName(Enum):
     START_DATE = 'start_date'
     END_DATE = 'end_date'
@@ -29,6 +115,17 @@ class DateAdjustment(Enum):
     INCREASE = 'increase'
 
 
+# IDs of the date inputs validated in on_input_changed
+_DATE_INPUT_IDS = frozenset({'start_date', 'end_date'})
+
+# Date deltas per adjustment, hoisted so the keyboard-repeat path does
+# not allocate and scale a fresh timedelta per keypress
+_DELTA = {
+    DateAdjustment.INCREASE: timedelta(days=1),
+    DateAdjustment.DECREASE: timedelta(days=-1),
+}
+
+
 class TaskEditScreen(ModalScreen):
     """
     Popup for entering task details.
@@ -50,14 +147,14 @@ class TaskEditScreen(ModalScreen):
         original_task: The original task object, if any, to be edited.
     """
     tuido_app: App
-    list_views: dict[str, ListView | Any] = {}
-    description_input: Input
-    priority_input: Select
-    start_date_input: MaskedInput
-    start_date_weekday_label: Label
-    end_date_input: MaskedInput
-    end_date_weekday_label: Label
-    invalid_inputs: set[str] = set()
+    list_views: dict[str, ListView | Any]
+    description_input: Input | None
+    priority_input: Select | None
+    start_date_input: MaskedInput | None
+    start_date_weekday_label: Label | None
+    end_date_input: MaskedInput | None
+    end_date_weekday_label: Label | None
+    invalid_inputs: set[str]
     original_task: Task | None = None
 
     BINDINGS = [
@@ -122,11 +219,38 @@ class TaskEditScreen(ModalScreen):
         super().__init__(**kwargs)
         self.tuido_app = tuido_app
         self.list_views = list_views
+        self._lv_cache = list(list_views.values())
+        self.invalid_inputs = set()
+        self._validate_timers: dict[str, tuple[Timer, Input]] = {}
+        self._last_valid: dict[str, bool] = {}
+        self._today_cache: tuple[int, str] | None = None
+        self._last_weekday: dict[str, str] = {}
+
+        # The input widgets are constructed lazily in compose; a task set
+        # via set_input_values before that is stored here and applied in
+        # on_mount
+        self.description_input = None
+        self.priority_input = None
+        self.start_date_input = None
+        self.start_date_weekday_label = None
+        self.end_date_input = None
+        self.end_date_weekday_label = None
+        self._date_inputs: dict[DateName, MaskedInput] = {}
+        self._weekday_labels: dict[str, tuple[MaskedInput, Label]] = {}
+        self._pending_task: Task | None = None
+
+    def compose(self) -> ComposeResult:
+        """
+        Creates the child widgets for the popup.
 
+        This includes input fields for task description, priority, start date,
+        end date, and a submit button. The widgets are constructed here
+        instead of in __init__ so a screen object only pays for its widget
+        tree once it is actually shown.
+        """
         self.description_input = Input(placeholder='Enter description')
 
-        priorities = ['Low', 'Medium', 'High']
-        self.priority_input = Select((option, option) for option in priorities)
+        self.priority_input = Select(_PRIORITY_OPTIONS)
         self.priority_input.id = 'priority_input'
 
         self.start_date_input = MaskedInput(
@@ -145,13 +269,22 @@ class TaskEditScreen(ModalScreen):
             '', id='task_end_date_weekday_label'
         )
 
-    def compose(self) -> ComposeResult:
-        """
-        Creates the child widgets for the popup.
+        # Maps a DateName to its input widget for the date adjustment
+        # actions
+        self._date_inputs = {
+            DateName.START_DATE: self.start_date_input,
+            DateName.END_DATE: self.end_date_input,
+        }
+
+        # Maps a date input ID to its input widget and weekday label so a
+        # single label can be updated without touching the other one
+        self._weekday_labels = {
+            'start_date': (self.start_date_input,
+                           self.start_date_weekday_label),
+            'end_date': (self.end_date_input,
+                         self.end_date_weekday_label),
+        }
 
-        This includes input fields for task description, priority, start date,
-        end date, and a submit button.
-        """
         with Static(id='main_container'):
             yield Label('Description:')
             yield self.description_input
@@ -190,10 +323,11 @@ class TaskEditScreen(ModalScreen):
             parameters: The action parameters.
         """
         # Suppress the save action if the priority input has focus or is
-        # expanded
-        priority_input: Select = self.priority_input
+        # expanded (or was not composed yet)
+        priority_input = self.priority_input
         if action == 'save':
-            if priority_input.has_focus or priority_input.expanded:
+            if priority_input is None \
+            or priority_input.has_focus or priority_input.expanded:
                 return None
 
         # Otherwise, process the action normally
@@ -268,19 +402,8 @@ class TaskEditScreen(ModalScreen):
                 end date when the start date is after the end date.
         """
         # Parse the date values from the input fields
-        try:
-            start_date = datetime.strptime(
-                self.start_date_input.value, "%Y-%m-%d"
-            )
-        except ValueError:
-            start_date = None
-
-        try:
-            end_date = datetime.strptime(
-                self.end_date_input.value, "%Y-%m-%d"
-            )
-        except ValueError:
-            end_date = None
+        start_date = _parse_ymd(self.start_date_input.value)
+        end_date = _parse_ymd(self.end_date_input.value)
 
         if not start_date or not end_date:
             return
@@ -342,33 +465,59 @@ class TaskEditScreen(ModalScreen):
         """
         Sets the input values in the popup based on the provided task.
 
+        If the widgets have not been composed yet, the task is stored and
+        the values are applied in on_mount.
+
         Args:
             task: The task object containing the values to be set.
         """
         self.original_task = task
-        self.description_input.value = task.description
 
-        match task.priority:
-            case TaskPriority.HIGH:
-                task_priority = 'High'
-            case TaskPriority.MEDIUM:
-                task_priority = 'Medium'
-            case TaskPriority.LOW:
-                task_priority = 'Low'
-            case TaskPriority.NONE:
-                task_priority = None
+        if self.description_input is None:
+            self._pending_task = task
+            return
+
+        self._apply_input_values(task)
+
+    def on_mount(self) -> None:
+        """
+        Applies input values that were set before the widgets existed.
+        """
+        if self._pending_task is not None:
+            self._apply_input_values(self._pending_task)
+            self._pending_task = None
+
+    def _apply_input_values(self, task: Task) -> None:
+        """
+        Writes the values of the given task into the composed input
+        widgets.
+
+        Args:
+            task: The task object containing the values to be set.
+        """
+        # Batch the writes so Textual coalesces the repaints into one
+        # frame; skip assignments whose value is already up to date since
+        # each one triggers reactive callbacks
+        with self.tuido_app.batch_update():
+            if self.description_input.value != task.description:
+                self.description_input.value = task.description
+
+            task_priority = _PRIORITY_LABEL.get(task.priority)
+
+            # self.priority_input.value = task_priority
+            self.call_after_refresh(self._set_priority_value, task_priority)
 
-        # self.priority_input.value = task_priority
-        self.call_after_refresh(self._set_priority_value, task_priority)
+            if self.start_date_input.value != task.start_date:
+                self.start_date_input.value = task.start_date
 
-        self.start_date_input.value = task.start_date
-        self.end_date_input.value = task.end_date
+            if self.end_date_input.value != task.end_date:
+                self.end_date_input.value = task.end_date
 
     def _set_priority_value(self, priority: str | None) -> None:
         """
         Helper method to set the priority input value delayed.
         """
-        if priority:
+        if priority and self.priority_input.value != priority:
             self.priority_input.value = priority
 
     def adjust_date(self, date_name: DateName, adjustment: DateAdjustment) \
@@ -381,30 +530,24 @@ class TaskEditScreen(ModalScreen):
             date_name: The name of the date input field (start or end date).
             adjustment: The type of adjustment (increase or decrease).
         """
-        # Get the input widget instance and determine the adjustment factor
-        match date_name:
-            case DateName.START_DATE:
-                input_widget: MaskedInput = self.start_date_input
-            case _:
-                input_widget: MaskedInput = self.end_date_input
+        # Get the input widget instance
+        input_widget: MaskedInput = self._date_inputs[date_name]
 
-        if adjustment == DateAdjustment.INCREASE:
-            delta_factor = 1
-        else:
-            delta_factor = -1
+        old_value = input_widget.value
 
         # Adjust the date in the input field
-        if input_widget.value:
-            # Try to parse the date and adjust it
-            try:
-                date = datetime.strptime(input_widget.value, "%Y-%m-%d")
-                new_date = date + timedelta(days=1) * delta_factor
-                input_widget.value = new_date.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+        if old_value:
+            # Adjust the date if it can be parsed
+            new_value = _shift_day(old_value, _DELTA[adjustment])
+            if new_value is not None:
+                input_widget.value = new_value
         else:
             # If the input is empty, set it to today's date
-            input_widget.value = datetime.now().strftime("%Y-%m-%d")
+            input_widget.value = self._today_str()
+
+        # Skip the sync and the repaint if the value could not be adjusted
+        if input_widget.value == old_value:
+            return
 
         # Make sure the start date is not after the end date
         if date_name == DateName.END_DATE \
@@ -415,6 +558,24 @@ class TaskEditScreen(ModalScreen):
         self.synchronize_start_and_end_date(adjust_start_date)
         input_widget.refresh()
 
+    def _today_str(self) -> str:
+        """
+        Returns today's date in the format "YYYY-MM-DD".
+
+        The string is cached per calendar day, so key-repeating a date
+        adjustment on an empty input does not re-format it every time.
+
+        Returns:
+            Today's date string.
+        """
+        today = date.today()
+        day = today.toordinal()
+
+        if self._today_cache is None or self._today_cache[0] != day:
+            self._today_cache = (day, today.isoformat())
+
+        return self._today_cache[1]
+
     def on_input_changed(self, event: Input.Changed) -> None:
         """
         Handles input change events.
@@ -429,19 +590,57 @@ class TaskEditScreen(ModalScreen):
         Args:
             event: The input change event.
         """
-        if event.input.id in ['start_date', 'end_date']:
-            value = event.value
+        if event.input.id in _DATE_INPUT_IDS:
+            # Debounce per input: restart only this input's timer so a
+            # change in one date field (e.g. both fields being populated
+            # when the screen opens) cannot cancel the other's pending
+            # validation
+            pending = self._validate_timers.pop(event.input.id, None)
+            if pending is not None:
+                pending[0].stop()
+
+            self._validate_timers[event.input.id] = (
+                self.set_timer(
+                    0.05, lambda: self._validate_date_input(event.input)
+                ),
+                event.input
+            )
+
+    def _validate_date_input(self, input_widget: Input) -> None:
+        """
+        Validates a date input field once the debounce timer fires.
+
+        If the input is valid, it removes the invalid class from the input
+        field. If the input is invalid, it adds the invalid class to the
+        input field and stores the input ID in the invalid_inputs set.
 
-            if self.is_valid_date(value) or value == '':
-                if event.input.id in self.invalid_inputs:
-                    self.invalid_inputs.remove(event.input.id)
-                event.input.remove_class('invalid_input')
+        Also updates the weekday labels for the start and end date inputs.
+
+        Args:
+            input_widget: The date input field to validate.
+        """
+        self._validate_timers.pop(input_widget.id, None)
+        value = input_widget.value
+        valid = _is_valid_date(value) or value == ''
+
+        if valid:
+            self.invalid_inputs.discard(input_widget.id)
+        else:
+            self.invalid_inputs.add(input_widget.id)
+
+        # Only toggle the class and repaint when the validity flipped
+        if valid != self._last_valid.get(input_widget.id):
+            self._last_valid[input_widget.id] = valid
+
+            if valid:
+                input_widget.remove_class('invalid_input')
             else:
-                self.invalid_inputs.add(event.input.id)
-                event.input.add_class('invalid_input')
+                input_widget.add_class('invalid_input')
+
+            input_widget.refresh()
 
-            self.update_weekday_labels()
-            event.input.refresh()
+        # Only the label belonging to the changed input can differ
+        self._update_weekday_label(input_widget.id)
 
     async def on_key(self, event: events.Key) -> None:
         """
@@ -462,30 +661,6 @@ class TaskEditScreen(ModalScreen):
         #     elif event.key == 'down':
         #         self.focus_next()
 
-    def is_valid_date(self, date_str: str) -> bool:
-        """
-        Validates the date format.
-
-        Checks if the date string is in the format YYYY-MM-DD and if it is a
-        valid date.
-
-        Args:
-            date_str: The date string to validate.
-
-        Returns:
-            bool: True if the date string is valid, False otherwise.
-        """
-        # Check if the date string matches the format YYYY-MM-DD
-        if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_str):
-            return False
-
-        # Check if the date string is a valid date
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
-
     def update_weekday_labels(self) -> None:
         """
         Sets the weekday labels for the start and end date inputs.
@@ -493,12 +668,23 @@ class TaskEditScreen(ModalScreen):
         This method updates the weekday labels based on the current values of
         the start and end date inputs.
         """
-        self.start_date_weekday_label.update(
-            self.get_weekday_name(self.start_date_input.value)
-        )
-        self.end_date_weekday_label.update(self.get_weekday_name(
-            self.end_date_input.value)
-        )
+        for input_id in self._weekday_labels:
+            self._update_weekday_label(input_id)
+
+    def _update_weekday_label(self, input_id: str) -> None:
+        """
+        Updates the weekday label belonging to a single date input.
+
+        Args:
+            input_id: The ID of the date input ('start_date' or 'end_date').
+        """
+        input_widget, label = self._weekday_labels[input_id]
+        weekday_name = self.get_weekday_name(input_widget.value)
+
+        # Skip the update (and the repaint it queues) if nothing changed
+        if weekday_name != self._last_weekday.get(input_id, ''):
+            self._last_weekday[input_id] = weekday_name
+            label.update(weekday_name)
 
     def get_weekday_name(self, date_str: str) -> str:
         """
@@ -510,15 +696,16 @@ class TaskEditScreen(ModalScreen):
         Returns:
             str: The name of the weekday.
         """
-        if not date_str:
+        # Incomplete strings cannot be a valid date, skip parsing them
+        if len(date_str) != 10:
             return ''
 
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            return f'({date.strftime('%A')})'
-        except ValueError:
+        parsed_date = _parse_ymd(date_str)
+        if parsed_date is None:
             return ''
 
+        return f'({_WEEKDAYS[parsed_date.weekday()]})'
+
     def submit_changes(self) -> None:
         """
         Submits the changes made in the popup.
@@ -526,6 +713,10 @@ class TaskEditScreen(ModalScreen):
         This method is called when the submit button is pressed. It sends a
         message with the entered data and clears the input fields.
         """
+        # Run validations still pending from the debounce timers, so
+        # invalid_inputs reflects the final input values
+        self._flush_pending_validation()
+
         if self.check_invalid_inputs():
             return
         else:
@@ -536,6 +727,17 @@ class TaskEditScreen(ModalScreen):
                 self.end_date_input.value
             ))
 
+    def _flush_pending_validation(self) -> None:
+        """
+        Stops the pending debounce timers and validates their inputs
+        immediately.
+        """
+        for timer, input_widget in list(self._validate_timers.values()):
+            timer.stop()
+            self._validate_date_input(input_widget)
+
+        self._validate_timers.clear()
+
     def check_invalid_inputs(self) -> bool:
         """
         Checks if there are any invalid inputs.
@@ -546,28 +748,48 @@ class TaskEditScreen(ModalScreen):
         Returns:
             bool: True if there are invalid inputs, False otherwise.
         """
-        if len(self.invalid_inputs) > 0:
-            self.app.notify(
-                'Please correct the invalid input(s) before submitting.',
-                severity='error'
-            )
-            return True
-        else:
+        if not self.invalid_inputs:
             return False
 
+        self.app.notify(
+            'Please correct the invalid input(s) before submitting.',
+            severity='error'
+        )
+        return True
+
     def set_list_view_state(self, enabled: bool) -> None:
         """
         Sets the state of the list views to either enabled or disabled.
+
+        List views that already have the target state are left alone so no
+        reactive updates are triggered for them.
         """
-        for list_view in self.list_views.values():
+        disabled = not enabled
+
+        for list_view in self._lv_cache:
+            if list_view.disabled == disabled:
+                continue
             list_view.can_focus = enabled
-            list_view.disabled = not enabled
+            list_view.disabled = disabled
 
     async def on_unmount(self, event: Message):
         """
         Called when the popup is unmounted.
 
-        This method is currently empty but can be used to perform any cleanup
-        actions when the popup is removed from the screen.
-        """
-        pass
+        Drops the references to the widget tree and the list views so the
+        GC can reclaim them once the screen object itself goes away.
+        """
+        for timer, _ in self._validate_timers.values():
+            timer.stop()
+        self._validate_timers.clear()
+
+        self.description_input = None
+        self.priority_input = None
+        self.start_date_input = None
+        self.start_date_weekday_label = None
+        self.end_date_input = None
+        self.end_date_weekday_label = None
+        self._date_inputs = {}
+        self._weekday_labels = {}
+        self.list_views = {}
+        self._lv_cache = []
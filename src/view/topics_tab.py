@@ -1,4 +1,5 @@
 import logging  # type: ignore # noqa
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.containers import HorizontalGroup, VerticalGroup, VerticalScroll
@@ -116,6 +117,30 @@ class TopicsDataTable(CustomDataTable):
         return int(selected_row[0].plain.strip())
 
 
+@lru_cache(maxsize=32)
+def _widget_builder(field_type: str, lines: int) -> str:
+    """
+    Returns the widget kind ('input', 'textarea' or 'select') for a field
+    configuration.
+
+    The field schema is static, so the dispatch result is cached per
+    (type, lines) pair and repeated mounts skip the match statement.
+
+    Args:
+        field_type: The type of the field (e.g., 'string', 'select').
+        lines: The number of lines for string fields.
+    """
+    match field_type:
+        case 'string':
+            return 'textarea' if lines != 1 else 'input'
+        case 'select':
+            return 'select'
+        case 'date':
+            return 'input'
+        case _:
+            raise ValueError(f'Unsupported field type: {field_type}')
+
+
 class TopicFormWidgets(VerticalGroup):
     """
     Form widgets for the topics tab.
@@ -125,10 +150,15 @@ class TopicFormWidgets(VerticalGroup):
         """
         Creates the child widgets.
         """
-        for form_row in Config.instance.fields:
+        # Bind the schema and the builder locally so the loop does not
+        # repeat the attribute lookups per field
+        fields = Config.instance.fields
+        create_form_element = self.create_form_element
+
+        for form_row in fields:
             with HorizontalGroup():
                 for form_col in form_row:
-                    yield self.create_form_element(form_col)
+                    yield create_form_element(form_col)
 
 
     def create_form_element(
@@ -152,19 +182,20 @@ class TopicFormWidgets(VerticalGroup):
         form_widget = self.create_widget(form_col)
 
         # Read-only?
-        if 'read_only' in form_col.keys() and form_col['read_only']:
+        if form_col.get('read_only'):
             form_widget.disabled = True
 
         # Set width of label and input widget if specified
-        if 'input_width' in form_col.keys() and form_col['input_width']:
-                label.styles.width = form_col['input_width']
-                form_widget.styles.width = form_col['input_width']
+        input_width = form_col.get('input_width')
+        if input_width:
+            label.styles.width = input_width
+            form_widget.styles.width = input_width
 
         # Group label and input
         vertical_group = VerticalGroup(label, form_widget)
 
-        if 'input_width' in form_col.keys() and form_col['input_width']:
-                vertical_group.styles.width = form_col['input_width']
+        if input_width:
+            vertical_group.styles.width = input_width
 
         return vertical_group
 
@@ -176,24 +207,15 @@ class TopicFormWidgets(VerticalGroup):
         Args:
             form_col: A dictionary containing the field configuration.
         """
-        form_widget: Input | TextArea | Select
-
-        match form_col['type']:
-            case 'string':
-                # Input or TextArea?
-                if 'lines' in form_col.keys() and int(form_col['lines']) != 1:
-                    form_widget = self.create_textarea(form_col)
-                else:
-                    form_widget = self.create_input(form_col)
-            case 'select':
-                form_widget = self.create_select(form_col)
-            case 'date':
-                form_widget = self.create_input(form_col)
-            case _:
-                raise ValueError('Unsupported field type: ' +
-                                    f'{form_col['type']}')
-
-        return form_widget
+        kind = _widget_builder(
+            form_col['type'], int(form_col.get('lines', 1))
+        )
+
+        if kind == 'textarea':
+            return self.create_textarea(form_col)
+        if kind == 'select':
+            return self.create_select(form_col)
+        return self.create_input(form_col)
 
     def create_input(self, form_col: dict[str, str | int | float | bool]) \
         -> Input:
@@ -235,7 +257,7 @@ class TopicFormWidgets(VerticalGroup):
         Args:
             form_col: A dictionary containing the field configuration.
         """
-        select = Select((option, option) for option in form_col['options'])
+        select = Select([(option, option) for option in form_col['options']])
         select.id = f'topics_{form_col['name']}_input'
         select.classes = 'form-input'
 